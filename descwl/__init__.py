@@ -8,10 +8,16 @@ __author__ = 'WeakLensingDeblending developers'
 __email__ = 'dkirkby@uci.edu'
 __version__ = '0.3dev'
 
-from . import catalog
-from . import survey
-from . import model
-from . import render
-from . import analysis
-from . import output
-from . import trace
+import importlib as _importlib
+
+# Submodules are imported on first access so that, for example, using only the catalog
+# module does not pay the cost of importing galsim.
+_submodules = ('catalog','survey','model','render','analysis','output','trace')
+
+def __getattr__(name):
+    if name in _submodules:
+        return _importlib.import_module('.' + name,__name__)
+    raise AttributeError('module %r has no attribute %r' % (__name__,name))
+
+def __dir__():
+    return sorted(set(globals()) | set(_submodules))
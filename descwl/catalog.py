@@ -83,13 +83,14 @@ class Reader(object):
         dec_size = (0.5*survey.image_height*survey.pixel_scale + margin_size)*arcsec2deg
         dec_min = self.dec_center - dec_size
         dec_max = self.dec_center + dec_size
-        # Iterate over all catalog entries.
-        for entry in self.table:
-            if self.only_id and entry['galtileid'] not in self.only_id:
+        # Iterate over all catalog entries, looking up the columns we need once rather
+        # than accessing them through each astropy.table.Row.
+        columns = zip(self.table['galtileid'].tolist(),self.table['ra'].tolist(),self.table['dec'].tolist())
+        for index,(entry_id,ra,dec) in enumerate(columns):
+            if self.only_id and entry_id not in self.only_id:
                 continue
-            if self.skip_id and entry['galtileid'] in self.skip_id:
+            if self.skip_id and entry_id in self.skip_id:
                 continue
-            ra,dec = entry['ra'],entry['dec']
             if ra > 180:
                 ra -= 360.
             if ra < ra_min or ra > ra_max or dec < dec_min or dec > dec_max:
@@ -97,7 +98,7 @@ class Reader(object):
             # If we get this far, the entry is visible.
             dx_arcsecs = (ra - self.ra_center)/arcsec2deg*ra_scale
             dy_arcsecs = (dec - self.dec_center)/arcsec2deg
-            yield entry,dx_arcsecs,dy_arcsecs
+            yield self.table[index],dx_arcsecs,dy_arcsecs
 
     @staticmethod
     def add_args(parser):
@@ -214,13 +215,14 @@ class ReaderStar(object):
         dec_size = (0.5*survey.image_height*survey.pixel_scale + margin_size)*arcsec2deg
         dec_min = self.dec_center - dec_size
         dec_max = self.dec_center + dec_size
-        # Iterate over all catalog entries.
-        for entry in self.table:
-            if self.only_star_id and entry['startileid'] not in self.only_star_id:
+        # Iterate over all catalog entries, looking up the columns we need once rather
+        # than accessing them through each astropy.table.Row.
+        columns = zip(self.table['startileid'].tolist(),self.table['ra'].tolist(),self.table['dec'].tolist())
+        for index,(entry_id,ra,dec) in enumerate(columns):
+            if self.only_star_id and entry_id not in self.only_star_id:
                 continue
-            if self.skip_id and entry['startileid'] in self.skip_id:
+            if self.skip_id and entry_id in self.skip_id:
                 continue
-            ra,dec = entry['ra'],entry['dec']
             if ra > 180:
                 ra -= 360.
             if ra < ra_min or ra > ra_max or dec < dec_min or dec > dec_max:
@@ -228,7 +230,7 @@ class ReaderStar(object):
             # If we get this far, the entry is visible.
             dx_arcsecs = (ra - self.ra_center)/arcsec2deg*ra_scale
             dy_arcsecs = (dec - self.dec_center)/arcsec2deg
-            yield entry,dx_arcsecs,dy_arcsecs
+            yield self.table[index],dx_arcsecs,dy_arcsecs
 
     @staticmethod
     def add_args(parser):
@@ -3,13 +3,85 @@
 from __future__ import print_function, division
 
 import math
-import inspect
+import functools
+import collections
 
 import numpy as np
 import numpy.linalg
 
 import galsim
 
+# GalSim does not currently provide a "delta-function" component to model a point source
+# so we use a very narrow Gaussian. See this GalSim issue for details:
+# https://github.com/GalSim-developers/GalSim/issues/533
+# Point sources (AGN and stars) are built by rescaling the flux of this unit-flux prototype.
+_POINT_SOURCE_PROTO = galsim.Gaussian(flux = 1., sigma = 1e-8)
+
+_SERSIC_PROFILES = { 1: galsim.Exponential, 4: galsim.DeVaucouleurs }
+_RAD = galsim.radians
+
+def _sersic_profile(n,flux,hlr,q,beta_radians):
+    """Build a sheared Sersic profile.
+
+    Args:
+        n(int): Sersic index of radial profile. Only n = 1 and n = 4 are supported.
+        flux(float): Total flux in detected electrons.
+        hlr(float): Radius of 50% isophote before shearing, in arcseconds.
+        q(float): Ratio b/a of Sersic isophotes after shearing.
+        beta_radians(float): Position angle of sheared isophotes in radians, measured
+            anti-clockwise from the positive x-axis.
+
+    Returns:
+        galsim.GSObject: Sheared profile with the requested flux.
+    """
+    return _SERSIC_PROFILES[n](flux = flux, half_light_radius = hlr).shear(
+        q = q, beta = beta_radians*_RAD)
+
+def _cached_sersic_profile(maxsize):
+    """Create a drop-in replacement for _sersic_profile() that caches shapes.
+
+    Sources with identical (n,hlr,q,beta) share a single unit-flux profile that is rescaled
+    with withFlux(). This only pays off for catalogs with many exactly repeated shapes, e.g.
+    grid simulations.
+
+    Args:
+        maxsize(int): Maximum number of unit-flux profiles to keep in the cache.
+
+    Returns:
+        callable: Function with the same signature as _sersic_profile().
+    """
+    unit_profile = functools.lru_cache(maxsize = maxsize)(
+        lambda n,hlr,q,beta_radians: _sersic_profile(n,1.,hlr,q,beta_radians))
+    def sersic_profile(n,flux,hlr,q,beta_radians):
+        return unit_profile(n,hlr,q,beta_radians).withFlux(flux)
+    return sersic_profile
+
+# Galaxy profile builders for each combination of disk (D), bulge (B) and AGN (A) components,
+# indexed by the bit mask D<<2 | B<<1 | A. All builders take the same args, in the order
+# (sersic,disk_flux,disk_hlr,disk_q,bulge_flux,bulge_hlr,bulge_q,agn_flux,beta_radians),
+# where sersic is _sersic_profile() or a cached replacement.
+def _build_D(sersic,disk_flux,disk_hlr,disk_q,bulge_flux,bulge_hlr,bulge_q,agn_flux,beta_radians):
+    return sersic(1,disk_flux,disk_hlr,disk_q,beta_radians)
+
+def _build_B(sersic,disk_flux,disk_hlr,disk_q,bulge_flux,bulge_hlr,bulge_q,agn_flux,beta_radians):
+    return sersic(4,bulge_flux,bulge_hlr,bulge_q,beta_radians)
+
+def _build_A(sersic,disk_flux,disk_hlr,disk_q,bulge_flux,bulge_hlr,bulge_q,agn_flux,beta_radians):
+    return _POINT_SOURCE_PROTO.withFlux(agn_flux)
+
+def _build_DB(*args):
+    return galsim.Add([_build_D(*args),_build_B(*args)])
+
+def _build_DA(*args):
+    return galsim.Add([_build_D(*args),_build_A(*args)])
+
+def _build_BA(*args):
+    return galsim.Add([_build_B(*args),_build_A(*args)])
+
+def _build_DBA(*args):
+    return galsim.Add([_build_D(*args),_build_B(*args),_build_A(*args)])
+
+_DISPATCH = (None,_build_A,_build_B,_build_BA,_build_D,_build_DA,_build_DB,_build_DBA)
 
 def sersic_second_moments(n,hlr,q,beta):
     """Calculate the second-moment tensor of a sheared Sersic radial profile.
@@ -42,7 +114,7 @@ def sersic_second_moments(n,hlr,q,beta):
     Q11 = 1 + e_mag_sq + 2*e1
     Q22 = 1 + e_mag_sq - 2*e1
     Q12 = 2*e2
-    return np.array(((Q11,Q12),(Q12,Q22)))*cn*hlr**2/(1-e_mag_sq)**2
+    return np.array(((Q11,Q12),(Q12,Q22)))*(cn*hlr**2/(1-e_mag_sq)**2)
     #return np.array(((Q11,Q12),(Q12,Q22)))*cn*hlr**2
 
 def moments_size_and_shape(Q):
@@ -137,6 +209,10 @@ class Galaxy(object):
             lengths for Sersic n=4 component. Ignored if bulge_flux is zero.
         agn_flux(float): Total flux in detected electrons of PSF-like component.
     """
+    # Function used to build the sheared Sersic components. GalaxyBuilder overrides this in
+    # a subclass when caching shapes.
+    _build_sersic = staticmethod(_sersic_profile)
+
     def __init__(self,identifier,redshift,ab_magnitude,ri_color,
         cosmic_shear_g1,cosmic_shear_g2,
         dx_arcsecs,dy_arcsecs,beta_radians,disk_flux,disk_hlr_arcsecs,disk_q,
@@ -149,7 +225,6 @@ class Galaxy(object):
         self.dy_arcsecs = dy_arcsecs
         self.cosmic_shear_g1 = cosmic_shear_g1
         self.cosmic_shear_g2 = cosmic_shear_g2
-        components = [ ]
         # Initialize second-moments tensor. Note that we can only add the tensors for the
         # n = 1,4 components, as we do below, since they have the same centroid.
         self.second_moments = np.zeros((2,2))
@@ -157,27 +232,22 @@ class Galaxy(object):
         self.disk_fraction = disk_flux/total_flux
         self.bulge_fraction = bulge_flux/total_flux
         if disk_flux > 0:
-            disk = galsim.Exponential(flux = disk_flux, half_light_radius = disk_hlr_arcsecs).shear(q = disk_q, beta = beta_radians*galsim.radians)
-            components.append(disk)
-            self.second_moments += self.disk_fraction*sersic_second_moments(
+            # Scale the component tensor in place to avoid allocating a temporary.
+            disk_moments = sersic_second_moments(
                 n=1,hlr=disk_hlr_arcsecs,q=disk_q,beta=beta_radians)
+            disk_moments *= self.disk_fraction
+            self.second_moments += disk_moments
 
         if bulge_flux > 0:
-            bulge = galsim.DeVaucouleurs(
-                flux = bulge_flux, half_light_radius = bulge_hlr_arcsecs).shear(
-                q = bulge_q, beta = beta_radians*galsim.radians)
-            components.append(bulge)
-            self.second_moments += self.bulge_fraction*sersic_second_moments(
+            bulge_moments = sersic_second_moments(
                 n=1,hlr=bulge_hlr_arcsecs,q=bulge_q,beta=beta_radians)
-        # GalSim does not currently provide a "delta-function" component to model the AGN
-        # so we use a very narrow Gaussian. See this GalSim issue for details:
-        # https://github.com/GalSim-developers/GalSim/issues/533
-        if agn_flux > 0:
-            agn = galsim.Gaussian(flux = agn_flux, sigma = 1e-8)
-            components.append(agn)
+            bulge_moments *= self.bulge_fraction
+            self.second_moments += bulge_moments
 
-        # Combine the components into our final profile.
-        self.profile = galsim.Add(components)
+        # Build our final profile from the components with nonzero flux.
+        mask = (disk_flux > 0) << 2 | (bulge_flux > 0) << 1 | (agn_flux > 0)
+        self.profile = _DISPATCH[mask](self._build_sersic,disk_flux,disk_hlr_arcsecs,disk_q,
+            bulge_flux,bulge_hlr_arcsecs,bulge_q,agn_flux,beta_radians)
         # Apply transforms to build the final model.
 
         self.model = self.get_transformed_model()
@@ -209,10 +279,27 @@ class Galaxy(object):
                 the requested transforms applied.
         """
 
-        return (self.profile
-            .dilate(1 + ds)
-            .shear(g1 = self.cosmic_shear_g1 + dg1,g2 = self.cosmic_shear_g2 + dg2)
-            .shift(dx = self.dx_arcsecs + dx,dy = self.dy_arcsecs + dy))
+        model = self.profile.dilate(1 + ds).shear(g1 = self.cosmic_shear_g1 + dg1,g2 = self.cosmic_shear_g2 + dg2)
+        # Only apply a shift transform for an off-center source.
+        dx_arcsecs,dy_arcsecs = self.dx_arcsecs + dx,self.dy_arcsecs + dy
+        if dx_arcsecs == 0 and dy_arcsecs == 0:
+            return model
+        return model.shift(dx = dx_arcsecs,dy = dy_arcsecs)
+
+GalaxyParams = collections.namedtuple('GalaxyParams',(
+    'identifier','redshift','ab_magnitude','ri_color','dx_arcsecs','dy_arcsecs',
+    'beta_radians','total_flux','disk_flux','disk_hlr_arcsecs','disk_q',
+    'bulge_flux','bulge_hlr_arcsecs','bulge_q','agn_flux'))
+GalaxyParams.__doc__ = """Galaxy model parameters for a table of catalog entries.
+
+Each field is a contiguous :class:`numpy.ndarray` with one element per entry, calculated by
+:meth:`GalaxyBuilder.precompute`. Every field owns its data, so it can be modified without
+changing the catalog table or any other field. Fields have the same meanings as the corresponding
+:class:`Galaxy` args, and total_flux is the catalog flux in detected electrons before any
+components are ignored. The shape fields (beta_radians,disk_hlr_arcsecs,disk_q,
+bulge_hlr_arcsecs,bulge_q) are stored in single precision and all other float fields in
+double precision.
+"""
 
 class GalaxyBuilder(object):
     """Build galaxy source models.
@@ -223,8 +310,19 @@ class GalaxyBuilder(object):
         no_bulge(bool): Ignore any Sersic n=4 component in the model if it is present in the catalog.
         no_agn(bool): Ignore any PSF-like component in the model if it is present in the catalog.
         verbose_model(bool): Provide verbose output from model building process.
+        shape_cache_size(int): Maximum number of distinct Sersic component shapes to cache,
+            or zero to disable caching. Caching only helps for catalogs with many exactly
+            repeated shapes.
+        flux_cache_size(int): Maximum number of distinct AB magnitudes whose flux is cached,
+            or zero to disable caching. Caching only helps for catalogs with many exactly
+            repeated magnitudes.
     """
-    def __init__(self,survey,no_disk,no_bulge,no_agn,verbose_model):
+    # Names of our constructor parameters, after survey, that can be set via from_args().
+    _parameter_names = ('no_disk','no_bulge','no_agn','verbose_model','shape_cache_size',
+        'flux_cache_size')
+
+    def __init__(self,survey,no_disk,no_bulge,no_agn,verbose_model,shape_cache_size = 0,
+        flux_cache_size = 0):
         if no_disk and no_bulge and no_agn:
             raise RuntimeError('Must build at least one galaxy component.')
         self.survey = survey
@@ -232,6 +330,16 @@ class GalaxyBuilder(object):
         self.no_bulge = no_bulge
         self.no_agn = no_agn
         self.verbose_model = verbose_model
+        self.shape_cache_size = shape_cache_size
+        if shape_cache_size > 0:
+            # Galaxies built by this subclass share a cache of Sersic component shapes.
+            self._galaxy_class = type('Galaxy',(Galaxy,),{
+                '_build_sersic': staticmethod(_cached_sersic_profile(shape_cache_size)) })
+        else:
+            self._galaxy_class = Galaxy
+        self.flux_cache_size = flux_cache_size
+        self._get_flux = (functools.lru_cache(maxsize = flux_cache_size)(survey.get_flux)
+            if flux_cache_size > 0 else survey.get_flux)
 
     def from_catalog(self,entry,dx_arcsecs,dy_arcsecs,filter_band):
         """Build a :class:Galaxy object from a catalog entry.
@@ -253,7 +361,8 @@ class GalaxyBuilder(object):
             :class:`Galaxy`: A newly created galaxy source model.
 
         Raises:
-            SourceNotVisible: All of the galaxy's components are being ignored.
+            SourceNotVisible: All of the galaxy's components are being ignored or have no
+                catalog flux.
             RuntimeError: Catalog entry is missing AB flux value in requested filter band.
         """
         # Calculate the object's total flux in detected electrons.
@@ -262,20 +371,28 @@ class GalaxyBuilder(object):
             ri_color = entry['r_ab'] - entry['i_ab']
         except KeyError:
             raise RuntimeError('Catalog entry is missing required AB magnitudes.')
-        total_flux = self.survey.get_flux(ab_magnitude)
-        # Calculate the flux of each component in detected electrons.
-        total_fluxnorm = entry['fluxnorm_disk'] + entry['fluxnorm_bulge'] + entry['fluxnorm_agn']
-        disk_flux = 0. if self.no_disk else entry['fluxnorm_disk']/total_fluxnorm*total_flux
-        bulge_flux = 0. if self.no_bulge else entry['fluxnorm_bulge']/total_fluxnorm*total_flux
-        agn_flux = 0. if self.no_agn else entry['fluxnorm_agn']/total_fluxnorm*total_flux
+        total_flux = self._get_flux(ab_magnitude)
+        # Calculate the flux of each component in detected electrons, using python floats
+        # rather than numpy scalars for the arithmetic.
+        fluxnorm_disk = float(entry['fluxnorm_disk'])
+        fluxnorm_bulge = float(entry['fluxnorm_bulge'])
+        fluxnorm_agn = float(entry['fluxnorm_agn'])
+        total_fluxnorm = fluxnorm_disk + fluxnorm_bulge + fluxnorm_agn
+        if total_fluxnorm == 0:
+            raise SourceNotVisible
+        flux_scale = float(total_flux)/total_fluxnorm
+        disk_flux = 0. if self.no_disk else fluxnorm_disk*flux_scale
+        bulge_flux = 0. if self.no_bulge else fluxnorm_bulge*flux_scale
+        agn_flux = 0. if self.no_agn else fluxnorm_agn*flux_scale
         # Is there any flux to simulate?
         if disk_flux + bulge_flux + agn_flux == 0:
             raise SourceNotVisible
         # Calculate the position of angle of the Sersic components, which are assumed to be the same.
         if disk_flux > 0:
-            beta_radians = math.radians(entry['pa_disk'])
+            pa_disk = entry['pa_disk']
             if bulge_flux > 0:
-                assert entry['pa_disk'] == entry['pa_bulge'],'Sersic components have different beta.'
+                assert pa_disk == entry['pa_bulge'],'Sersic components have different beta.'
+            beta_radians = math.radians(pa_disk)
         elif bulge_flux > 0:
             beta_radians = math.radians(entry['pa_bulge'])
         else:
@@ -283,40 +400,182 @@ class GalaxyBuilder(object):
             beta_radians = None
         # Calculate shapes hlr = sqrt(a*b) and q = b/a of Sersic components.
         if disk_flux > 0:
-            a_d,b_d = entry['a_d'],entry['b_d']
+            a_d,b_d = float(entry['a_d']),float(entry['b_d'])
             disk_hlr_arcsecs = math.sqrt(a_d*b_d)
             disk_q = b_d/a_d
         else:
             disk_hlr_arcsecs,disk_q = None,None
         if bulge_flux > 0:
-            a_b,b_b = entry['a_b'],entry['b_b']
+            a_b,b_b = float(entry['a_b']),float(entry['b_b'])
             bulge_hlr_arcsecs = math.sqrt(a_b*b_b)
             bulge_q = b_b/a_b
-            bulge_beta = math.radians(entry['pa_bulge'])
         else:
             bulge_hlr_arcsecs,bulge_q = None,None
         # Look up extra catalog metadata.
         identifier = entry['galtileid']
         redshift = entry['redshift']
         if self.verbose_model:
-            print('Building galaxy model for id=%d with z=%.3f' % (identifier,redshift))
-            print('flux = %.3g detected electrons (%s-band AB = %.1f)' % (
-                total_flux,filter_band,ab_magnitude))
-            print('centroid at (%.6f,%.6f) arcsec relative to image center, beta = %.6f rad' % (
-                dx_arcsecs,dy_arcsecs,beta_radians))
-            if disk_flux > 0:
-                print(' disk: frac = %.6f, hlr = %.6f arcsec, q = %.6f' % (
-                    disk_flux/total_flux,disk_hlr_arcsecs,disk_q))
-            if bulge_flux > 0:
-                print('bulge: frac = %.6f, hlr = %.6f arcsec, q = %.6f' % (
-                    bulge_flux/total_flux,bulge_hlr_arcsecs,bulge_q))
-            if agn_flux > 0:
-                print('  AGN: frac = %.6f' % (agn_flux/total_flux))
-        return Galaxy(identifier,redshift,ab_magnitude,ri_color,
+            self._print_model(identifier,redshift,ab_magnitude,filter_band,total_flux,
+                dx_arcsecs,dy_arcsecs,beta_radians,disk_flux,disk_hlr_arcsecs,disk_q,
+                bulge_flux,bulge_hlr_arcsecs,bulge_q,agn_flux)
+        return self._galaxy_class(identifier,redshift,ab_magnitude,ri_color,
             self.survey.cosmic_shear_g1,self.survey.cosmic_shear_g2,
             dx_arcsecs,dy_arcsecs,beta_radians,disk_flux,disk_hlr_arcsecs,disk_q,
             bulge_flux,bulge_hlr_arcsecs,bulge_q,agn_flux)
 
+    def _print_model(self,identifier,redshift,ab_magnitude,filter_band,total_flux,
+        dx_arcsecs,dy_arcsecs,beta_radians,disk_flux,disk_hlr_arcsecs,disk_q,
+        bulge_flux,bulge_hlr_arcsecs,bulge_q,agn_flux):
+        """Print a summary of a galaxy model being built.
+
+        Only called when verbose_model is set, so that no formatting is done otherwise.
+        Args have the same meanings as the corresponding :class:`Galaxy` args, with total_flux
+        the catalog flux in detected electrons before any components are ignored.
+        """
+        print('Building galaxy model for id=%d with z=%.3f' % (identifier,redshift))
+        print('flux = %.3g detected electrons (%s-band AB = %.1f)' % (
+            total_flux,filter_band,ab_magnitude))
+        if disk_flux > 0 or bulge_flux > 0:
+            print('centroid at (%.6f,%.6f) arcsec relative to image center, beta = %.6f rad' % (
+                dx_arcsecs,dy_arcsecs,beta_radians))
+        else:
+            print('centroid at (%.6f,%.6f) arcsec relative to image center' % (
+                dx_arcsecs,dy_arcsecs))
+        if disk_flux > 0:
+            print(' disk: frac = %.6f, hlr = %.6f arcsec, q = %.6f' % (
+                disk_flux/total_flux,disk_hlr_arcsecs,disk_q))
+        if bulge_flux > 0:
+            print('bulge: frac = %.6f, hlr = %.6f arcsec, q = %.6f' % (
+                bulge_flux/total_flux,bulge_hlr_arcsecs,bulge_q))
+        if agn_flux > 0:
+            print('  AGN: frac = %.6f' % (agn_flux/total_flux))
+
+    def precompute(self,entries,dx_arcsecs,dy_arcsecs,filter_band):
+        """Calculate galaxy model parameters for a table of catalog entries.
+
+        The flux and shape calculations of :meth:`from_catalog` are vectorized over catalog
+        columns and the results are stored as one contiguous array per parameter.
+
+        Args:
+            entries(astropy.table.Table): Table of rows from a galaxy :mod:`descwl.catalog`.
+            dx_arcsecs(numpy.ndarray): Horizontal offsets of each entry's centroid from image
+                center in arcseconds.
+            dy_arcsecs(numpy.ndarray): Vertical offsets of each entry's centroid from image
+                center in arcseconds.
+            filter_band(str): The LSST filter band to use for calculating flux, which must
+                be one of 'u','g','r','i','z','y'.
+
+        Returns:
+            :class:`GalaxyParams`: Arrays of model parameters with one element per entry.
+                Shape parameters of components with zero flux are calculated but not meaningful.
+
+        Raises:
+            RuntimeError: Catalog is missing AB flux values in requested filter band.
+        """
+        # Calculate each object's total flux in detected electrons.
+        try:
+            ab_magnitude = np.array(entries[filter_band + '_ab'],dtype=float,copy=True)
+            ri_color = np.asarray(entries['r_ab'],dtype=float) - np.asarray(entries['i_ab'],dtype=float)
+        except KeyError:
+            raise RuntimeError('Catalog entry is missing required AB magnitudes.')
+        total_flux = self.survey.get_flux_array(ab_magnitude)
+        # Calculate the flux of each component in detected electrons.
+        fluxnorm_disk = np.asarray(entries['fluxnorm_disk'],dtype=float)
+        fluxnorm_bulge = np.asarray(entries['fluxnorm_bulge'],dtype=float)
+        fluxnorm_agn = np.asarray(entries['fluxnorm_agn'],dtype=float)
+        # Entries with no catalog flux in any component get zero flux, so are not visible.
+        total_fluxnorm = fluxnorm_disk + fluxnorm_bulge + fluxnorm_agn
+        flux_scale = np.zeros_like(total_flux)
+        np.divide(total_flux,total_fluxnorm,out = flux_scale,where = total_fluxnorm != 0)
+        disk_flux = np.zeros_like(total_flux) if self.no_disk else fluxnorm_disk*flux_scale
+        bulge_flux = np.zeros_like(total_flux) if self.no_bulge else fluxnorm_bulge*flux_scale
+        agn_flux = np.zeros_like(total_flux) if self.no_agn else fluxnorm_agn*flux_scale
+        # Calculate position angles, which must agree when both Sersic components are present.
+        has_disk = disk_flux > 0
+        pa_disk = np.asarray(entries['pa_disk'],dtype=float)
+        pa_bulge = np.asarray(entries['pa_bulge'],dtype=float)
+        has_both = has_disk & (bulge_flux > 0)
+        assert np.all(pa_disk[has_both] == pa_bulge[has_both]),'Sersic components have different beta.'
+        beta_radians = np.radians(np.where(has_disk,pa_disk,pa_bulge)).astype(np.float32)
+        # Calculate shapes hlr = sqrt(a*b) and q = b/a of Sersic components in single precision.
+        a_d,b_d = np.asarray(entries['a_d'],dtype=np.float32),np.asarray(entries['b_d'],dtype=np.float32)
+        a_b,b_b = np.asarray(entries['a_b'],dtype=np.float32),np.asarray(entries['b_b'],dtype=np.float32)
+        with np.errstate(divide = 'ignore',invalid = 'ignore'):
+            disk_hlr_arcsecs = np.sqrt(a_d*b_d)
+            disk_q = b_d/a_d
+            bulge_hlr_arcsecs = np.sqrt(a_b*b_b)
+            bulge_q = b_b/a_b
+        shape = total_flux.shape
+        return GalaxyParams(
+            identifier = np.array(entries['galtileid'],copy=True),
+            redshift = np.array(entries['redshift'],dtype=np.float64,copy=True),
+            ab_magnitude = ab_magnitude,ri_color = ri_color,
+            dx_arcsecs = np.array(np.broadcast_to(dx_arcsecs,shape),dtype=np.float64,copy=True),
+            dy_arcsecs = np.array(np.broadcast_to(dy_arcsecs,shape),dtype=np.float64,copy=True),
+            beta_radians = beta_radians,total_flux = total_flux,
+            disk_flux = disk_flux,disk_hlr_arcsecs = disk_hlr_arcsecs,disk_q = disk_q,
+            bulge_flux = bulge_flux,bulge_hlr_arcsecs = bulge_hlr_arcsecs,bulge_q = bulge_q,
+            agn_flux = agn_flux)
+
+    def from_catalog_batch(self,entries,dx_arcsecs,dy_arcsecs,filter_band):
+        """Build :class:Galaxy objects from a table of catalog entries.
+
+        This gives the same results as calling :meth:`from_catalog` for each entry, to
+        single precision, but the flux and shape calculations are vectorized by
+        :meth:`precompute` so that only the final :class:`Galaxy` construction is done one
+        entry at a time. Position angles and Sersic shapes are rounded to single precision,
+        and entries without a Sersic component are passed a (never used) beta_radians
+        calculated from pa_bulge instead of None.
+
+        Args:
+            entries(astropy.table.Table): Table of rows from a galaxy :mod:`descwl.catalog`.
+            dx_arcsecs(numpy.ndarray): Horizontal offsets of each entry's centroid from image
+                center in arcseconds.
+            dy_arcsecs(numpy.ndarray): Vertical offsets of each entry's centroid from image
+                center in arcseconds.
+            filter_band(str): The LSST filter band to use for calculating flux, which must
+                be one of 'u','g','r','i','z','y'.
+
+        Returns:
+            list: List of newly created :class:`Galaxy` source models, with one element per
+                entry. Any entry whose components are all being ignored or have no catalog flux
+                is represented by None.
+
+        Raises:
+            RuntimeError: Catalog is missing AB flux values in requested filter band.
+        """
+        params = self.precompute(entries,dx_arcsecs,dy_arcsecs,filter_band)
+        visible = (params.disk_flux + params.bulge_flux + params.agn_flux != 0).tolist()
+        # Convert each parameter array to a list of python scalars once.
+        values = GalaxyParams(*[ column.tolist() for column in params ])
+        g1,g2 = self.survey.cosmic_shear_g1,self.survey.cosmic_shear_g2
+        verbose = self.verbose_model
+        galaxy_class = self._galaxy_class
+        # Build a Galaxy for each visible entry.
+        galaxies = [ ]
+        for index,is_visible in enumerate(visible):
+            if not is_visible:
+                galaxies.append(None)
+                continue
+            identifier = values.identifier[index]
+            redshift = values.redshift[index]
+            ab_magnitude = values.ab_magnitude[index]
+            dx,dy = values.dx_arcsecs[index],values.dy_arcsecs[index]
+            beta_radians = values.beta_radians[index]
+            disk_flux = values.disk_flux[index]
+            disk_hlr_arcsecs,disk_q = values.disk_hlr_arcsecs[index],values.disk_q[index]
+            bulge_flux = values.bulge_flux[index]
+            bulge_hlr_arcsecs,bulge_q = values.bulge_hlr_arcsecs[index],values.bulge_q[index]
+            agn_flux = values.agn_flux[index]
+            if verbose:
+                self._print_model(identifier,redshift,ab_magnitude,filter_band,
+                    values.total_flux[index],dx,dy,beta_radians,disk_flux,disk_hlr_arcsecs,disk_q,
+                    bulge_flux,bulge_hlr_arcsecs,bulge_q,agn_flux)
+            galaxies.append(galaxy_class(identifier,redshift,ab_magnitude,values.ri_color[index],
+                g1,g2,dx,dy,beta_radians,disk_flux,disk_hlr_arcsecs,disk_q,
+                bulge_flux,bulge_hlr_arcsecs,bulge_q,agn_flux))
+        return galaxies
+
     @staticmethod
     def add_args(parser):
         """Add command-line arguments for constructing a new :class:`GalaxyBuilder`.
@@ -335,6 +594,10 @@ class GalaxyBuilder(object):
             help = 'Ignore any PSF-like component in the model if it is present in the catalog.')
         parser.add_argument('--verbose-model', action = 'store_true',
             help = 'Provide verbose output from model building process.')
+        parser.add_argument('--shape-cache-size', type = int, default = 0, metavar = 'N',
+            help = 'Cache up to N distinct Sersic component shapes (0 disables caching).')
+        parser.add_argument('--flux-cache-size', type = int, default = 0, metavar = 'N',
+            help = 'Cache the fluxes of up to N distinct AB magnitudes (0 disables caching).')
 
     @classmethod
     def from_args(cls,survey,args):
@@ -349,12 +612,10 @@ class GalaxyBuilder(object):
         Returns:
             :class:`GalaxyBuilder`: A newly constructed Reader object.
         """
-        # Look up the named constructor parameters.
-        pnames = (inspect.getargspec(cls.__init__)).args[1:]
         # Get a dictionary of the arguments provided.
         args_dict = vars(args)
         # Filter the dictionary to only include constructor parameters.
-        filtered_dict = { key:args_dict[key] for key in (set(pnames) & set(args_dict)) }
+        filtered_dict = { key:args_dict[key] for key in cls._parameter_names if key in args_dict }
         return cls(survey,**filtered_dict)
 
 class Star(object):
@@ -384,14 +645,13 @@ class Star(object):
         self.dy_arcsecs = dy_arcsecs
         components = [ ]
         total_flux = star_flux
-        # GalSim does not currently provide a "delta-function" component to model the AGN
-        # so we use a very narrow Gaussian. See this GalSim issue for details:
-        # https://github.com/GalSim-developers/GalSim/issues/533
+        # GalSim does not currently provide a "delta-function" component to model the star
+        # so we rescale a shared very narrow Gaussian. See _POINT_SOURCE_PROTO for details.
         if star_flux > 0:
-            star = galsim.Gaussian(flux = star_flux, sigma = 1e-8)
+            star = _POINT_SOURCE_PROTO.withFlux(star_flux)
             components.append(star)
-        # Combine the components into our final profile.
-        self.profile = galsim.Add(components)
+        # Combine the components into our final profile, avoiding a trivial sum.
+        self.profile = components[0] if len(components) == 1 else galsim.Add(components)
         # Apply transforms to build the final model.
         self.model = self.get_transformed_model()
 
@@ -416,10 +676,12 @@ class Star(object):
             galsim.GSObject: New model constructed using our source profile with
                 the requested transforms applied.
         """
-        return (self.profile
-            .dilate(1 + ds)
-            .shear(g1 = dg1,g2 = dg2)
-            .shift(dx = self.dx_arcsecs + dx,dy = self.dy_arcsecs + dy))
+        model = self.profile.dilate(1 + ds).shear(g1 = dg1,g2 = dg2)
+        # Only apply a shift transform for an off-center source.
+        dx_arcsecs,dy_arcsecs = self.dx_arcsecs + dx,self.dy_arcsecs + dy
+        if dx_arcsecs == 0 and dy_arcsecs == 0:
+            return model
+        return model.shift(dx = dx_arcsecs,dy = dy_arcsecs)
 
 class StarBuilder(object):
     """Build star source models.
@@ -428,6 +690,9 @@ class StarBuilder(object):
         survey(descwl.survey.Survey): Survey to use for flux normalization and cosmic shear.
         verbose_star-model(bool): Provide verbose output from model building process.
     """
+    # Names of our constructor parameters, after survey, that can be set via from_args().
+    _parameter_names = ('verbose_model',)
+
     def __init__(self,survey,verbose_model):
         self.survey = survey
         self.verbose_model = verbose_model
@@ -504,10 +769,8 @@ class StarBuilder(object):
         Returns:
             :class:`StarBuilder`: A newly constructed ReaderStar object.
         """
-        # Look up the named constructor parameters.
-        pnames = (inspect.getargspec(cls.__init__)).args[1:]
         # Get a dictionary of the arguments provided.
         args_dict = vars(args)
         # Filter the dictionary to only include constructor parameters.
-        filtered_dict = { key:args_dict[key] for key in (set(pnames) & set(args_dict)) }
+        filtered_dict = { key:args_dict[key] for key in cls._parameter_names if key in args_dict }
         return cls(survey,**filtered_dict)
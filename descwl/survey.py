@@ -142,6 +142,19 @@ class Survey(object):
         ab_magnitude += self.extinction*(self.airmass -zeropoint_airmass)
         return self.exposure_time*self.zero_point*10**(-0.4*(ab_magnitude-24))
 
+    def get_flux_array(self,ab_magnitudes):
+        """Convert an array of source magnitudes to fluxes.
+
+        This is a vectorized version of :meth:`get_flux` that does not modify its input.
+
+        Args:
+            ab_magnitudes(numpy.ndarray): AB magnitudes of sources.
+
+        Returns:
+            numpy.ndarray: Fluxes in detected electrons, with the same shape as the input.
+        """
+        return self.get_flux(np.array(ab_magnitudes,dtype=float))
+
     def get_image_coordinates(self,dx_arcsecs,dy_arcsecs):
         """Convert a physical offset from the image center into image coordinates.
 